@@ -24,21 +24,17 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import random
 import sys
 from pathlib import Path
 from typing import Any, Dict
 
-import httpx
+import orjson
 
-from src.jules_client import (
-    JulesAPIError,
-    JulesClient,
-    _build_prompt,
-    _extract_agent_messages,
-    _extract_json_fragment,
-    _raise_for_status,
-)
+# httpx and src.jules_client are imported lazily inside the functions that need
+# them: importing the client module configures logging (and creates the log
+# directory) as a side effect, and argument-parsing failures should not pay
+# that cost.
 from src.models.review import (
     FilePatch,
     PullRequestReviewContext,
@@ -60,6 +56,16 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Path to a JSON webhook payload from GitHub (push events supported)",
     )
+    source_group.add_argument(
+        "--context-glob",
+        help="Glob matching several context JSON files; their sessions are polled concurrently",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum sessions polled in parallel with --context-glob",
+    )
     parser.add_argument(
         "--api-key",
         default=None,
@@ -107,11 +113,16 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional session title override",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Pretty-print full session and activities payloads on every attempt",
+    )
     return parser.parse_args()
 
 
 def load_context(path: Path) -> ReviewContext:
-    raw = json.loads(path.read_text())
+    raw = orjson.loads(path.read_bytes())
     context_type = raw.get("type")
     if context_type not in {"push", "pull_request"}:
         raise ValueError("Context JSON must include 'type' of 'push' or 'pull_request'")
@@ -153,7 +164,9 @@ def load_context(path: Path) -> ReviewContext:
 
 
 async def load_context_from_push_event(path: Path, token: str | None) -> PushReviewContext:
-    payload = json.loads(path.read_text())
+    import httpx
+
+    payload = orjson.loads(path.read_bytes())
     repo = payload["repository"]
     full_name = repo["full_name"]
     owner, name = full_name.split("/", 1)
@@ -219,7 +232,17 @@ async def create_and_poll(
     attempts: int,
     delay: float,
     page_size: int,
+    verbose: bool = False,
 ) -> None:
+    from src.jules_client import (
+        JulesAPIError,
+        JulesClient,
+        _build_prompt,
+        _extract_agent_messages,
+        _extract_json_fragment,
+        _raise_for_status,
+    )
+
     client = JulesClient(api_key, base_url=base_url, timeout=timeout)
     session_name: str | None = None
     try:
@@ -232,7 +255,8 @@ async def create_and_poll(
 
         print("=== Creating session ===")
         session = await client._create_session(context, prompt, title=session_title)
-        print(json.dumps(session, indent=2))
+        if verbose:
+            print(orjson.dumps(session, option=orjson.OPT_INDENT_2).decode())
         print()
 
         session_name = session.get("name")
@@ -246,13 +270,21 @@ async def create_and_poll(
 
         for attempt in range(attempts):
             attempt_no = attempt + 1
-            try:
-                response = await client._client.get(
+            # The activities and session GETs are independent, so issue them
+            # concurrently; each attempt costs max(t1, t2) instead of t1 + t2.
+            activities_result, session_result = await asyncio.gather(
+                client._client.get(
                     f"/{session_name}/activities",
                     params={"pageSize": page_size},
-                )
-                _raise_for_status("list activities", response)
-                payload: Dict[str, Any] = response.json()
+                ),
+                client._client.get(f"/{session_name}"),
+                return_exceptions=True,
+            )
+            try:
+                if isinstance(activities_result, BaseException):
+                    raise activities_result
+                _raise_for_status("list activities", activities_result)
+                payload: Dict[str, Any] = activities_result.json()
             except JulesAPIError as exc:
                 last_error = exc
                 message = str(exc)
@@ -279,16 +311,17 @@ async def create_and_poll(
             print(f"--- Activities payload (attempt {attempt_no}) ---")
             activities = payload.get("activities", [])
             print(f"Total activities: {len(activities)}")
-            if activities:
-                print(json.dumps(payload, indent=2))
-            else:
-                print("{}")
+            # Pretty-printing a large payload every attempt is CPU-heavy and
+            # floods stdout; keep the one-line summary unless asked for more.
+            if verbose and activities:
+                print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
             
-            # Also check session state
+            # Also check session state (fetched concurrently above)
             try:
-                session_response = await client._client.get(f"/{session_name}")
-                _raise_for_status("get session", session_response)
-                session_data = session_response.json()
+                if isinstance(session_result, BaseException):
+                    raise session_result
+                _raise_for_status("get session", session_result)
+                session_data = session_result.json()
                 print(f"--- Session state (attempt {attempt_no}) ---")
                 print(f"State: {session_data.get('state', 'UNKNOWN')}")
                 print(f"Update time: {session_data.get('updateTime', 'N/A')}")
@@ -302,20 +335,19 @@ async def create_and_poll(
                     print(f"\n>>> Agent fragment {idx + 1} >>>")
                     print(text[:500] + "..." if len(text) > 500 else text)
                     if parsed := _extract_json_fragment(text):
+                        # _extract_json_fragment returns the already-parsed dict.
                         print("\n### Parsed JSON fragment ###")
-                        try:
-                            parsed_json = json.loads(parsed)
-                            print(json.dumps(parsed_json, indent=2))
-                            print("\n✓ JSON successfully extracted!")
-                            return
-                        except json.JSONDecodeError:
-                            print(parsed)
+                        print(orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode())
+                        print("\n✓ JSON successfully extracted!")
+                        return
             else:
                 print("No agent messages found")
             print("\n" + "="*60 + "\n")
 
             if attempt < attempts - 1:
-                wait_time = delay * (attempt_no) / attempts
+                # Exponential backoff with jitter: short waits while the session is
+                # fresh, longer (but de-synchronized) waits as it drags on.
+                wait_time = min(30.0, delay * 2 ** attempt) * random.uniform(0.5, 1.5)
                 await asyncio.sleep(wait_time)
 
         print("Polling completed with no JSON fragment detected.")
@@ -337,6 +369,39 @@ async def async_main() -> None:
 
     github_token = args.github_token or getenv("GITHUB_TOKEN")
 
+    poll_kwargs = dict(
+        api_key=api_key,
+        base_url=args.base_url,
+        timeout=args.timeout,
+        title=args.title,
+        attempts=args.attempts,
+        delay=args.delay,
+        page_size=args.page_size,
+        verbose=args.verbose,
+    )
+
+    if args.context_glob:
+        from glob import glob
+
+        paths = sorted(glob(args.context_glob))
+        if not paths:
+            print(f"No context files match {args.context_glob!r}", file=sys.stderr)
+            sys.exit(1)
+        contexts = [load_context(Path(p)) for p in paths]
+
+        # Poll all sessions concurrently, bounded so a large sweep does not
+        # open an unreasonable number of sessions at once.
+        semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+        async def _bounded_poll(ctx: ReviewContext) -> None:
+            async with semaphore:
+                await create_and_poll(ctx, **poll_kwargs)
+
+        async with asyncio.TaskGroup() as tg:
+            for ctx in contexts:
+                tg.create_task(_bounded_poll(ctx))
+        return
+
     try:
         if args.context_file:
             context = load_context(args.context_file)
@@ -346,16 +411,7 @@ async def async_main() -> None:
         print(f"Failed to load context: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    await create_and_poll(
-        context,
-        api_key=api_key,
-        base_url=args.base_url,
-        timeout=args.timeout,
-        title=args.title,
-        attempts=args.attempts,
-        delay=args.delay,
-        page_size=args.page_size,
-    )
+    await create_and_poll(context, **poll_kwargs)
 
 
 if __name__ == "__main__":  # pragma: no cover - script entry point
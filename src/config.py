@@ -77,7 +77,7 @@ class Settings(BaseModel):
         )
 
 
-_TRUE_VALUES: Final[set[str]] = {"1", "true", "yes", "on"}
+_TRUE_VALUES: Final[frozenset[str]] = frozenset({"1", "true", "yes", "on"})
 
 
 def _parse_bool_env(raw_value: str | None, *, default: bool = False) -> bool:
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Protocol, Sequence
 
 import httpx
 import jwt
+import orjson
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from src.logger import get_logger, log_with_context, log_timing
 
 
@@ -23,8 +29,141 @@ class GitHubAPIError(RuntimeError):
 DEFAULT_ACCEPT_HEADER = "application/vnd.github+json"
 DEFAULT_API_VERSION = "2022-11-28"
 
+# Transparent retry policy for transient GitHub failures. 5xx retries apply
+# to GETs only: a gateway 5xx on a POST can surface after GitHub already
+# applied the write, and retrying would double-post the review. 429 means
+# the request was not processed, so it retries regardless of method.
+MAX_REQUEST_RETRIES = 4
+RETRY_BACKOFF_BASE_SECONDS = 0.5
+RETRY_BACKOFF_CAP_SECONDS = 8.0
+_RETRYABLE_5XX_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Delay before retrying a throttled/failed request, honoring Retry-After."""
+
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    backoff = min(RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt)
+    # Jitter de-synchronizes concurrent retries so they do not re-burst together.
+    return backoff * random.uniform(0.5, 1.0)
+
+
+# Client-side rate-limit pacing. When the remaining quota reported by GitHub
+# drops below the floor, hold new requests until the reported reset time
+# instead of burning the last slots and hard-failing with 403/429. GitHub
+# meters each installation token (and the app JWT) separately, so pauses are
+# keyed by Authorization header — one tenant draining its quota must not
+# stall reviews for every other installation.
+RATE_LIMIT_FLOOR = 50
+_rate_limit_pauses: Dict[str, float] = {}
+
+
+def _prune_rate_limit_pauses(now: float) -> None:
+    expired = [key for key, deadline in _rate_limit_pauses.items() if deadline <= now]
+    for key in expired:
+        _rate_limit_pauses.pop(key, None)
+
+
+def _rate_limit_pause(auth_key: str) -> float:
+    deadline = _rate_limit_pauses.get(auth_key)
+    if deadline is None:
+        return 0.0
+    return deadline - time.time()
+
+
+def _note_rate_limit(auth_key: str, response: httpx.Response) -> None:
+    try:
+        remaining = int(response.headers["X-RateLimit-Remaining"])
+        reset = float(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return
+    # Expired entries also age out here; tokens rotate hourly, so the dict
+    # would otherwise accumulate dead keys.
+    _prune_rate_limit_pauses(time.time())
+    if remaining < RATE_LIMIT_FLOOR:
+        _rate_limit_pauses[auth_key] = max(_rate_limit_pauses.get(auth_key, 0.0), reset)
+
 logger = get_logger()
 
+# Conditional-request cache for GET responses. GitHub serves 304 Not Modified
+# against a matching If-None-Match without charging the rate limit, so
+# re-fetching unchanged compares/PR file lists costs a ~300-byte response.
+# Bounded: entries hold full response bodies, so evict least-recently-used
+# once the cap is reached (dicts iterate in insertion order).
+ETAG_CACHE_MAX_ENTRIES = 256
+_etag_cache: Dict[str, tuple[str, httpx.Response]] = {}
+
+
+def _etag_cache_store(cache_key: str, etag: str, response: httpx.Response) -> None:
+    _etag_cache.pop(cache_key, None)
+    _etag_cache[cache_key] = (etag, response)
+    while len(_etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+        _etag_cache.pop(next(iter(_etag_cache)))
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a response body with orjson; notably faster on large file lists."""
+
+    return orjson.loads(response.content) if response.content else None
+
+
+def _etag_key(url: str, params: Dict[str, Any] | None) -> str:
+    if not params:
+        return url
+    return url + "?" + "&".join(f"{key}={params[key]}" for key in sorted(params))
+
+
+# Process-wide pooled clients, keyed by base URL. Review jobs construct a
+# fresh GitHubInstallationClient per webhook; sharing the underlying transport
+# keeps TCP+TLS connections alive across jobs instead of handshaking every
+# time. Production uses a single GitHub API host, but keying by URL means a
+# differently-configured caller (GitHub Enterprise, a test pointing at a mock
+# server) gets its own pool instead of silently reusing another host's.
+_shared_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_shared_client(
+    base_url: str,
+    *,
+    timeout: float = 10.0,
+    user_agent: str = "Jules-CodeReviewer/1.0",
+) -> httpx.AsyncClient:
+    """Return the pooled HTTP client for ``base_url``, creating it on first use."""
+
+    key = base_url.rstrip("/")
+    client = _shared_clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=key,
+            timeout=timeout,
+            # H2 multiplexes concurrent calls (parallel pagination, comment
+            # fan-out) over one TLS connection; keep-alives cover bursts.
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            headers={
+                "User-Agent": user_agent,
+                "Accept": DEFAULT_ACCEPT_HEADER,
+                "X-GitHub-Api-Version": DEFAULT_API_VERSION,
+            },
+        )
+        _shared_clients[key] = client
+    return client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared pooled clients (app shutdown / tests)."""
+
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
+
 
 class GitHubAppClient:
     """Lightweight client for GitHub App manifest conversion."""
@@ -45,15 +184,8 @@ class GitHubAppClient:
 
     def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self._base_url,
-                timeout=self._timeout,
-                headers={
-                    "User-Agent": self._user_agent,
-                    "Accept": DEFAULT_ACCEPT_HEADER,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                },
-            )
+            self._client = get_shared_client(self._base_url, timeout=self._timeout)
+            self._owns_client = False
         return self._client
 
     async def convert_manifest(self, code: str) -> Dict[str, Any]:
@@ -61,13 +193,13 @@ class GitHubAppClient:
 
         url = f"/app-manifests/{code}/conversions"
         client = self._get_client()
-        response = await client.post(url)
+        response = await client.post(url, headers={"User-Agent": self._user_agent})
 
         if response.status_code >= 400:
             detail: Any | None
             if response.content:
                 try:
-                    detail = response.json()
+                    detail = _json(response)
                 except ValueError:
                     detail = response.text
             else:
@@ -78,7 +210,7 @@ class GitHubAppClient:
             raise GitHubAPIError(message, response.status_code, detail)
 
         try:
-            return response.json()
+            return _json(response)
         except ValueError as exc:  # pragma: no cover - defensive branch
             raise GitHubAPIError(
                 "GitHub API returned invalid JSON during manifest conversion.",
@@ -99,11 +231,83 @@ class InstallationToken:
     token: str
     expires_at: datetime
     permissions: Dict[str, Any] | None = None
+    # Epoch-seconds mirror of expires_at; is_active runs on every API call
+    # and a float compare beats datetime arithmetic there.
+    expires_at_ts: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.expires_at_ts = self.expires_at.timestamp()
 
     def is_active(self, *, skew_seconds: int = 60) -> bool:
         """Return True if the token is still valid accounting for clock skew."""
 
-        return self.expires_at - timedelta(seconds=skew_seconds) > datetime.now(timezone.utc)
+        return self.expires_at_ts - skew_seconds > time.time()
+
+
+# Upper bound on cached installation tokens; apps with very many
+# installations should not pin a token per installation forever.
+MAX_CACHED_INSTALLATION_TOKENS = 1024
+
+# Concurrent page fetches per paginated listing; more mostly trips GitHub's
+# secondary rate limits rather than finishing faster.
+PAGINATION_CONCURRENCY = 8
+
+
+class TokenStore(Protocol):
+    """Pluggable storage for installation tokens.
+
+    The default is process-local; deployments running several workers can
+    inject a shared backend so tokens survive restarts and are fetched once
+    per expiry cycle instead of once per process.
+    """
+
+    def get(self, installation_id: int) -> InstallationToken | None: ...
+
+    def set(self, installation_id: int, token: InstallationToken) -> None: ...
+
+
+class InMemoryTokenStore:
+    """Bounded in-process token store; the default TokenStore."""
+
+    def __init__(self, *, max_entries: int = MAX_CACHED_INSTALLATION_TOKENS) -> None:
+        self._max_entries = max_entries
+        self._tokens: Dict[int, InstallationToken] = {}
+
+    def get(self, installation_id: int) -> InstallationToken | None:
+        return self._tokens.get(installation_id)
+
+    def set(self, installation_id: int, token: InstallationToken) -> None:
+        if len(self._tokens) >= self._max_entries:
+            self._evict_stale()
+        self._tokens[installation_id] = token
+
+    def _evict_stale(self) -> None:
+        expired = [iid for iid, cached in self._tokens.items() if not cached.is_active()]
+        for iid in expired:
+            del self._tokens[iid]
+        # Still at capacity with live tokens: shed the soonest-to-expire.
+        while len(self._tokens) >= self._max_entries:
+            soonest = min(self._tokens, key=lambda iid: self._tokens[iid].expires_at)
+            del self._tokens[soonest]
+
+
+# Shared by default so per-webhook client instances reuse each other's
+# tokens, mirroring the shared HTTP pool above.
+_default_token_store = InMemoryTokenStore()
+
+# Singleflight guards: concurrent jobs for one installation should mint a
+# token once, not once per coroutine. Locks are created lazily per id.
+_token_locks: Dict[int, asyncio.Lock] = {}
+
+
+@lru_cache(maxsize=1024)
+def _split_full_name(full_name: str) -> tuple[str, str]:
+    """Split "owner/repo"; memoized since the same repos repeat every job."""
+
+    if "/" not in full_name:
+        raise ValueError(f"Repository full name '{full_name}' is invalid.")
+    owner, repo = full_name.split("/", 1)
+    return owner, repo
 
 
 class GitHubInstallationClient:
@@ -118,55 +322,61 @@ class GitHubInstallationClient:
         timeout: float = 10.0,
         user_agent: str = "Jules-CodeReviewer/1.0",
         client: httpx.AsyncClient | None = None,
+        token_store: TokenStore | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._user_agent = user_agent
         self._app_id = app_id
         # Normalize private key: handle escaped newlines from environment variables
-        self._private_key = private_key_pem.replace("\\n", "\n")
-        self._client = client or httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=self._timeout,
-            headers={
-                "User-Agent": self._user_agent,
-                "Accept": DEFAULT_ACCEPT_HEADER,
-                "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-            },
-        )
-        self._owns_client = client is None
-        self._installation_tokens: Dict[int, InstallationToken] = {}
+        normalized_pem = private_key_pem.replace("\\n", "\n")
+        # Parse the PEM once; signing with the key object skips the ASN.1
+        # parse PyJWT would otherwise redo on every encode. An invalid PEM
+        # falls through to jwt.encode, which raises the descriptive error.
+        try:
+            self._private_key: Any = load_pem_private_key(normalized_pem.encode("utf-8"), password=None)
+        except (ValueError, TypeError):
+            self._private_key = normalized_pem
+        if client is None:
+            client = get_shared_client(self._base_url, timeout=self._timeout, user_agent=self._user_agent)
+        self._client = client
+        # The client is either the shared pool or caller-owned; never closed here.
+        self._owns_client = False
+        self._token_store = token_store if token_store is not None else _default_token_store
+        self._cached_jwt: tuple[str, float] | None = None
 
     def _build_jwt(self) -> str:
-        now = datetime.now(timezone.utc)
+        now_ts = time.time()
+        # RS256 signing is CPU-bound (~1ms); reuse the JWT until shortly
+        # before its 10-minute expiry instead of re-signing per request.
+        if self._cached_jwt is not None:
+            token, expires_at_ts = self._cached_jwt
+            if now_ts < expires_at_ts - 60.0:
+                return token
         payload = {
-            "iat": int((now - timedelta(seconds=60)).timestamp()),
-            "exp": int((now + timedelta(minutes=10)).timestamp()),
+            "iat": int(now_ts) - 60,
+            "exp": int(now_ts) + 600,
             "iss": self._app_id,
         }
         try:
-            return jwt.encode(payload, self._private_key, algorithm="RS256")
+            token = jwt.encode(payload, self._private_key, algorithm="RS256")
         except Exception as exc:
             raise GitHubAPIError(
                 f"Failed to encode JWT: {exc}. Check that GITHUB_PRIVATE_KEY is a valid RSA private key in PEM format.",
                 0,
                 None,
             ) from exc
+        self._cached_jwt = (token, now_ts + 600.0)
+        return token
 
+    # Accept and X-GitHub-Api-Version are set once on the shared client, so
+    # per-request headers only need to carry the credential.
     def _app_headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._build_jwt()}",
-            "Accept": DEFAULT_ACCEPT_HEADER,
-            "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-        }
+        return {"Authorization": f"Bearer {self._build_jwt()}"}
 
     @staticmethod
     def _installation_headers(token: str) -> Dict[str, str]:
-        return {
-            "Authorization": f"Bearer {token}",
-            "Accept": DEFAULT_ACCEPT_HEADER,
-            "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-        }
+        return {"Authorization": f"Bearer {token}"}
 
     async def _request(
         self,
@@ -181,23 +391,60 @@ class GitHubInstallationClient:
         """Make a GitHub API request with logging and error categorization."""
         operation = operation or f"{method} {url}"
         ctx_logger = log_with_context(logger, operation=operation)
-        
-        try:
-            with log_timing(ctx_logger, operation):
-                response = await self._client.request(method, url, headers=headers, params=params, json=json)
-        except httpx.RequestError as exc:
-            ctx_logger.error(f"GitHub API request failed (network error): {exc}")
-            raise GitHubAPIError(
-                f"GitHub API request to {url} failed: {exc}",
-                0,
-                None,
-            ) from exc
-        
+
+        # Serialize payloads once with orjson instead of letting httpx run
+        # stdlib json per attempt.
+        content = orjson.dumps(json) if json is not None else None
+        if content is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+
+        cache_key = _etag_key(url, params) if method == "GET" else None
+        cached = _etag_cache.get(cache_key) if cache_key else None
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        auth_key = headers.get("Authorization", "")
+        while (pause := _rate_limit_pause(auth_key)) > 0:
+            ctx_logger.warning(f"Approaching GitHub rate limit; pausing {pause:.1f}s before {url}")
+            await asyncio.sleep(min(pause, 60.0))
+
+        for attempt in range(MAX_REQUEST_RETRIES + 1):
+            try:
+                with log_timing(ctx_logger, operation):
+                    response = await self._client.request(method, url, headers=headers, params=params, content=content)
+            except httpx.RequestError as exc:
+                ctx_logger.error(f"GitHub API request failed (network error): {exc}")
+                raise GitHubAPIError(
+                    f"GitHub API request to {url} failed: {exc}",
+                    0,
+                    None,
+                ) from exc
+
+            retryable = response.status_code == 429 or (
+                method == "GET" and response.status_code in _RETRYABLE_5XX_STATUS_CODES
+            )
+            if retryable and attempt < MAX_REQUEST_RETRIES:
+                delay = _retry_delay(response, attempt)
+                ctx_logger.warning(
+                    f"Transient GitHub error ({response.status_code}) for {url}; "
+                    f"retrying in {delay:.2f}s (attempt {attempt + 1}/{MAX_REQUEST_RETRIES})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            break
+
+        _note_rate_limit(auth_key, response)
+
+        if cached and response.status_code == 304:
+            ctx_logger.debug(f"Not modified (304); serving cached response for {url}")
+            _etag_cache_store(cache_key, cached[0], cached[1])  # refresh recency
+            return cached[1]
+
         if response.status_code >= 400:
             detail: Any | None
             if response.content:
                 try:
-                    detail = response.json()
+                    detail = _json(response)
                 except ValueError:
                     detail = response.text
             else:
@@ -224,6 +471,11 @@ class GitHubInstallationClient:
                 detail,
             )
         
+        if cache_key:
+            etag = response.headers.get("ETag")
+            if etag:
+                _etag_cache_store(cache_key, etag, response)
+
         ctx_logger.debug(f"Request successful (status={response.status_code})")
         return response
 
@@ -249,7 +501,7 @@ class GitHubInstallationClient:
                 ctx_logger.error("Permission denied - check GitHub App permissions")
             raise
         
-        data = response.json()
+        data = _json(response)
         token_value = data.get("token")
         if not token_value:
             ctx_logger.error("GitHub did not return an installation token")
@@ -278,22 +530,24 @@ class GitHubInstallationClient:
     async def get_installation_token(
         self, installation_id: int, permissions: Dict[str, Any] | None = None
     ) -> InstallationToken:
-        cached = self._installation_tokens.get(installation_id)
+        cached = self._token_store.get(installation_id)
         if cached and cached.is_active():
             logger.debug(f"Using cached installation token for installation {installation_id}")
             return cached
 
-        logger.debug(f"Fetching new installation token for installation {installation_id}")
-        token = await self._fetch_installation_token(installation_id, permissions)
-        self._installation_tokens[installation_id] = token
-        return token
+        lock = _token_locks.setdefault(installation_id, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have minted the token while we waited.
+            cached = self._token_store.get(installation_id)
+            if cached and cached.is_active():
+                return cached
+            logger.debug(f"Fetching new installation token for installation {installation_id}")
+            token = await self._fetch_installation_token(installation_id, permissions)
+            self._token_store.set(installation_id, token)
+            return token
 
-    @staticmethod
-    def _split_full_name(full_name: str) -> tuple[str, str]:
-        if "/" not in full_name:
-            raise ValueError(f"Repository full name '{full_name}' is invalid.")
-        owner, repo = full_name.split("/", 1)
-        return owner, repo
+    # Kept as a staticmethod alias so existing call sites stay unchanged.
+    _split_full_name = staticmethod(_split_full_name)
 
     async def get_commit_compare(
         self,
@@ -314,32 +568,33 @@ class GitHubInstallationClient:
             headers=self._installation_headers(token.token),
             operation="get_commit_compare",
         )
-        return response.json()
+        return _json(response)
 
-    async def list_pull_request_files(
+    async def iter_pull_request_files(
         self,
         *,
         installation_id: int,
         full_name: str,
         pull_number: int,
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield changed files for a PR as their pages arrive.
+
+        Later pages are fetched concurrently while earlier ones are being
+        consumed, so callers can start work without buffering the whole
+        listing.
+        """
+
         ctx_logger = log_with_context(logger, repository=full_name, operation="list_pull_request_files")
         ctx_logger.debug(f"Fetching files for PR #{pull_number}")
-        
+
         token = await self.get_installation_token(installation_id)
         owner, repo = self._split_full_name(full_name)
 
-        files: List[Dict[str, Any]] = []
-        page = 1
-        while True:
-            response = await self._request(
-                "GET",
-                f"/repos/{owner}/{repo}/pulls/{pull_number}/files",
-                headers=self._installation_headers(token.token),
-                params={"per_page": 100, "page": page},
-                operation=f"list_pull_request_files_page_{page}",
-            )
-            batch = response.json()
+        url = f"/repos/{owner}/{repo}/pulls/{pull_number}/files"
+        headers = self._installation_headers(token.token)
+
+        def _extract_batch(response: httpx.Response, page: int) -> List[Dict[str, Any]]:
+            batch = _json(response)
             if not isinstance(batch, list):
                 ctx_logger.error(f"Unexpected response format for PR files (page {page})")
                 raise GitHubAPIError(
@@ -347,13 +602,62 @@ class GitHubInstallationClient:
                     response.status_code,
                     batch,
                 )
-            files.extend(batch)
-            ctx_logger.debug(f"Fetched {len(batch)} files from page {page} (total: {len(files)})")
-            if len(batch) < 100:
-                break
-            page += 1
-        
-        ctx_logger.info(f"Fetched {len(files)} total files for PR #{pull_number}")
+            return batch
+
+        first = await self._request(
+            "GET",
+            url,
+            headers=headers,
+            params={"per_page": 100, "page": 1},
+            operation="list_pull_request_files_page_1",
+        )
+        for file in _extract_batch(first, 1):
+            yield file
+
+        # The first response's Link header tells us the total page count, so
+        # the remaining pages can be fetched concurrently instead of serially.
+        last_page = _last_page_number(first)
+        if last_page > 1:
+            semaphore = asyncio.Semaphore(PAGINATION_CONCURRENCY)
+
+            async def _fetch_page(page: int) -> httpx.Response:
+                async with semaphore:
+                    return await self._request(
+                        "GET",
+                        url,
+                        headers=headers,
+                        params={"per_page": 100, "page": page},
+                        operation=f"list_pull_request_files_page_{page}",
+                    )
+
+            remaining = range(2, last_page + 1)
+            tasks = [asyncio.ensure_future(_fetch_page(page)) for page in remaining]
+            try:
+                for page, task in zip(remaining, tasks):
+                    for file in _extract_batch(await task, page):
+                        yield file
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def list_pull_request_files(
+        self,
+        *,
+        installation_id: int,
+        full_name: str,
+        pull_number: int,
+    ) -> List[Dict[str, Any]]:
+        files = [
+            file
+            async for file in self.iter_pull_request_files(
+                installation_id=installation_id,
+                full_name=full_name,
+                pull_number=pull_number,
+            )
+        ]
+        log_with_context(logger, repository=full_name, operation="list_pull_request_files").info(
+            f"Fetched {len(files)} total files for PR #{pull_number}"
+        )
         return files
 
     async def create_pull_request_review(
@@ -363,16 +667,15 @@ class GitHubInstallationClient:
         full_name: str,
         pull_number: int,
         body: str | None,
-        comments: Iterable[Dict[str, Any]],
+        comments: Sequence[Dict[str, Any]],
         event: str = "COMMENT",
     ) -> Dict[str, Any]:
         ctx_logger = log_with_context(logger, repository=full_name, operation="create_pull_request_review")
-        comments_list = list(comments)
-        ctx_logger.info(f"Creating PR review for PR #{pull_number} with {len(comments_list)} comments")
-        
+        ctx_logger.info(f"Creating PR review for PR #{pull_number} with {len(comments)} comments")
+
         token = await self.get_installation_token(installation_id)
         owner, repo = self._split_full_name(full_name)
-        payload: Dict[str, Any] = {"event": event, "comments": comments_list}
+        payload: Dict[str, Any] = {"event": event, "comments": comments}
         if body:
             payload["body"] = body
         
@@ -384,7 +687,7 @@ class GitHubInstallationClient:
             operation="create_pull_request_review",
         )
         ctx_logger.info(f"PR review created successfully for PR #{pull_number}")
-        return response.json()
+        return _json(response)
 
     async def create_commit_comment(
         self,
@@ -419,7 +722,48 @@ class GitHubInstallationClient:
             operation="create_commit_comment",
         )
         ctx_logger.debug(f"Commit comment created successfully for {commit_sha[:8]}")
-        return response.json()
+        return _json(response)
+
+    async def create_commit_comments_bulk(
+        self,
+        *,
+        installation_id: int,
+        full_name: str,
+        commit_sha: str,
+        comments: Sequence[Dict[str, Any]],
+        concurrency: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Post many comments on one commit, resolving token and URL once.
+
+        Each entry is a ready commit-comment payload ("body" plus optional
+        "path"/"line"/"position"). POSTs overlap under a semaphore instead of
+        paying one full auth-plus-round-trip cycle per comment.
+        """
+
+        if not comments:
+            return []
+
+        ctx_logger = log_with_context(logger, repository=full_name, operation="create_commit_comments_bulk")
+        ctx_logger.debug(f"Posting {len(comments)} comment(s) to commit {commit_sha[:8]}")
+
+        token = await self.get_installation_token(installation_id)
+        owner, repo = self._split_full_name(full_name)
+        url = f"/repos/{owner}/{repo}/commits/{commit_sha}/comments"
+        headers = self._installation_headers(token.token)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _post(payload: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                response = await self._request(
+                    "POST",
+                    url,
+                    headers=headers,
+                    json=payload,
+                    operation="create_commit_comment",
+                )
+                return _json(response)
+
+        return await asyncio.gather(*(_post(payload) for payload in comments))
 
     async def aclose(self) -> None:
         if self._owns_client and self._client is not None:
@@ -427,7 +771,34 @@ class GitHubInstallationClient:
             self._client = None
 
 
+def _last_page_number(response: httpx.Response) -> int:
+    """Read the final page number from a paginated response's Link header."""
+
+    last = response.links.get("last")
+    if not last or "url" not in last:
+        return 1
+    try:
+        return int(httpx.URL(last["url"]).params.get("page", "1"))
+    except ValueError:
+        return 1
+
+
 def _parse_github_timestamp(raw: str) -> datetime:
+    # GitHub emits fixed-width "YYYY-MM-DDTHH:MM:SSZ"; build the datetime
+    # directly for that shape and keep fromisoformat as the general fallback.
+    if len(raw) == 20 and raw[-1] == "Z":
+        try:
+            return datetime(
+                int(raw[0:4]),
+                int(raw[5:7]),
+                int(raw[8:10]),
+                int(raw[11:13]),
+                int(raw[14:16]),
+                int(raw[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
     if raw.endswith("Z"):
         raw = raw[:-1] + "+00:00"
     return datetime.fromisoformat(raw).astimezone(timezone.utc)
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import random
 import re
 import time
-from typing import Any, Dict, Iterable, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Sequence
 
 import httpx
+import orjson
 
 from src.logger import get_logger, log_with_context, log_timing, log_failure
 from src.models.review import (
@@ -21,6 +25,79 @@ from src.models.review import (
 
 logger = get_logger()
 
+# Splits a unified diff into whole hunks at each "@@" header (compiled once;
+# _truncate_patch runs for every oversized patch in every prompt).
+_HUNK_HEADER_RE = re.compile(r"(?m)(?=^@@ )")
+
+# Shared decoder for raw_decode scanning in _extract_json_fragment; the
+# decoder itself is stateless so one instance serves every call.
+_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=1024)
+def _source_for(repository: str) -> str:
+    """Map an ``owner/repo`` full name to its Jules source path.
+
+    Cached because repository identity is stable across the many sessions a
+    busy installation creates; raises ValueError on malformed names.
+    """
+    owner, _, name = repository.partition("/")
+    if not owner or not name:
+        raise ValueError(f"Invalid repository format: {repository}. Expected 'owner/repo'.")
+    return f"sources/github/{owner}/{name}"
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a response body with orjson (markedly faster on large payloads)."""
+    return orjson.loads(response.content)
+
+
+def _activity_preview(activity: Dict[str, Any], *, limit: int = 1000) -> str:
+    preview = json.dumps(activity, indent=2)
+    if len(preview) > limit:
+        preview = preview[:limit] + "\n... (truncated)"
+    return preview
+
+# Static reviewer instructions shared by every prompt; assembled once at import
+# instead of on each _build_prompt call.
+_INSTRUCTIONS = (
+    "You are an automated code reviewer. Analyze the provided Git diff patches and "
+    "return actionable findings. Respond *only* with valid JSON matching this schema:\n"
+    "{\n"
+    "  \"summary\": string,\n"
+    "  \"comments\": [\n"
+    "    {\n"
+    "      \"path\": string,\n"
+    "      \"start_line\": integer,\n"
+    "      \"end_line\": integer|null,\n"
+    "      \"message\": string,\n"
+    "      \"severity\": one of [\"critical\", \"major\", \"minor\", \"info\"]\n"
+    "    }\n"
+    "  ]\n"
+    "}\n"
+    "Focus on bugs, security issues, or major regressions. Omit stylistic nitpicks."
+)
+
+ANALYSIS_CACHE_TTL_SECONDS = 60 * 60  # reuse analyses of identical prompts for one hour
+_analysis_cache: Dict[str, tuple[float, ReviewAnalysis]] = {}
+
+
+def _prune_analysis_cache(now: float) -> None:
+    expiry_threshold = now - ANALYSIS_CACHE_TTL_SECONDS
+    expired = [key for key, (timestamp, _) in _analysis_cache.items() if timestamp < expiry_threshold]
+    for key in expired:
+        _analysis_cache.pop(key, None)
+
+
+def _cached_analysis(cache_key: str, now: float) -> ReviewAnalysis | None:
+    _prune_analysis_cache(now)
+    entry = _analysis_cache.get(cache_key)
+    return entry[1] if entry else None
+
+
+def _store_analysis(cache_key: str, analysis: ReviewAnalysis, now: float) -> None:
+    _analysis_cache[cache_key] = (now, analysis)
+
 
 class JulesAPIError(RuntimeError):
     """Raised when the Jules API responds with an error."""
@@ -33,10 +110,20 @@ class JulesClient:
         *,
         base_url: str = "https://jules.googleapis.com/v1alpha",
         timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
     ) -> None:
         self._client = httpx.AsyncClient(
             base_url=base_url.rstrip("/"),
             timeout=timeout,
+            # A review issues one POST plus many polling GETs to the same host;
+            # HTTP/2 multiplexes them all over a single kept-alive connection.
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=60.0,
+            ),
             headers={
                 "X-Goog-Api-Key": api_key,
                 "Content-Type": "application/json",
@@ -54,6 +141,13 @@ class JulesClient:
             prompt = _build_prompt(context)
         ctx_logger.debug(f"Prompt built: {len(prompt)} characters")
 
+        # Identical prompts (webhook redeliveries, workflow re-runs on the same
+        # SHA range) produce identical reviews, so skip the round-trip entirely.
+        cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        if cached := _cached_analysis(cache_key, time.time()):
+            ctx_logger.info("Reusing cached Jules analysis for identical prompt")
+            return cached
+
         ctx_logger.info("Creating Jules session")
         try:
             with log_timing(ctx_logger, "create_jules_session"):
@@ -94,43 +188,59 @@ class JulesClient:
             session_ctx_logger.warning("Jules returned no analysis")
             return ReviewAnalysis()
 
-        session_ctx_logger.debug(f"Parsing Jules response ({len(raw_response)} characters)")
+        session_ctx_logger.debug(f"Parsing Jules response ({len(raw_response)} top-level keys)")
         try:
             analysis = _parse_analysis(raw_response)
         except Exception as exc:
-            log_failure(logger, f"Failed to parse Jules response: {exc}", exc, 
+            log_failure(logger, f"Failed to parse Jules response: {exc}", exc,
                        repository=context.repository, session_id=session_id)
             raise JulesAPIError("Unable to parse Jules response into review findings.") from exc
-        
-        if not analysis:
-            log_failure(logger, "Jules response parsed but produced no analysis", 
-                       repository=context.repository, session_id=session_id)
-            raise JulesAPIError("Unable to parse Jules response into review findings.")
-        
+
         session_ctx_logger.info(f"Jules analysis parsed: {len(analysis.comments)} comments, "
                                f"summary={'yes' if analysis.summary else 'no'}")
+        _store_analysis(cache_key, analysis, time.time())
         return analysis
 
+    async def analyze_many(
+        self, contexts: Sequence[ReviewContext], *, concurrency: int = 8
+    ) -> List[ReviewAnalysis]:
+        """Analyze several contexts concurrently over the shared client.
+
+        Each analysis spends most of its wall time sleeping between polls, so
+        running up to ``concurrency`` of them in parallel brings total time
+        close to the slowest individual review rather than the sum. Results
+        are returned in input order; any failure cancels the remaining tasks.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(context: ReviewContext) -> ReviewAnalysis:
+            async with semaphore:
+                return await self.analyze(context)
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_bounded(context)) for context in contexts]
+        return [task.result() for task in tasks]
+
     async def _create_session(self, context: ReviewContext, prompt: str, *, title: str) -> Dict[str, Any]:
         ctx_logger = log_with_context(logger, repository=context.repository)
         
-        # Parse repository name (format: "owner/repo")
-        repo_parts = context.repository.split("/", 1)
-        if len(repo_parts) != 2:
-            raise JulesAPIError(f"Invalid repository format: {context.repository}. Expected 'owner/repo'.")
-        owner, repo = repo_parts
+        # Map repository (format: "owner/repo") to its cached source path
+        try:
+            source = _source_for(context.repository)
+        except ValueError as exc:
+            raise JulesAPIError(str(exc)) from exc
 
         # Build sourceContext
-        source_context: Dict[str, Any] = {
-            "source": f"sources/github/{owner}/{repo}",
-        }
+        source_context: Dict[str, Any] = {"source": source}
 
         # Add branch information if available
         github_repo_context: Dict[str, Any] = {}
         if isinstance(context, PushReviewContext) and context.ref:
-            # Extract branch name from ref (format: "refs/heads/main" -> "main")
-            if context.ref.startswith("refs/heads/"):
-                branch = context.ref.replace("refs/heads/", "")
+            # Extract branch name from ref (format: "refs/heads/main" -> "main");
+            # removeprefix returns the ref unchanged for tag refs etc., and the
+            # prefix is non-empty, so inequality means it was stripped.
+            branch = context.ref.removeprefix("refs/heads/")
+            if branch != context.ref:
                 github_repo_context["startingBranch"] = branch
         elif isinstance(context, PullRequestReviewContext) and context.head_ref:
             # For PRs, use the head branch ref directly (already in branch name format)
@@ -139,24 +249,25 @@ class JulesClient:
         if github_repo_context:
             source_context["githubRepoContext"] = github_repo_context
 
-        source_path = source_context.get("source")
-        ctx_logger.info(f"Creating Jules session for source: {source_path}")
-        
+        ctx_logger.info(f"Creating Jules session for source: {source}")
+
         request_body = {
             "prompt": prompt,
             "title": title,
             "sourceContext": source_context,
         }
-        ctx_logger.debug(f"Session request: source={source_path}, "
+        ctx_logger.debug(f"Session request: source={source}, "
                          f"prompt_length={len(prompt)}, has_branch={'startingBranch' in github_repo_context}")
         
         try:
             response = await self._client.post(
                 "/sessions",
-                json=request_body,
+                # Serialize with orjson instead of httpx's stdlib encoder; the
+                # prompt can run to tens of KB. Content-Type is set client-wide.
+                content=orjson.dumps(request_body),
             )
             _raise_for_status("create session", response)
-            session_response = response.json()
+            session_response = _json(response)
             ctx_logger.debug("Session created successfully")
             return session_response
         except JulesAPIError as exc:
@@ -174,13 +285,6 @@ class JulesClient:
                 ctx_logger.error(f"Jules API error: {exc}")
             raise
 
-    async def _send_message(self, session_id: str, prompt: str) -> None:
-        response = await self._client.post(
-            f"/{session_id}:sendMessage",
-            json={"prompt": prompt},
-        )
-        _raise_for_status("send message", response)
-
     async def _wait_for_session_ready(
         self, 
         session_id: str, 
@@ -221,7 +325,7 @@ class JulesClient:
                 # Try to get the session - if it exists, it's ready
                 response = await self._client.get(f"/{session_id}")
                 _raise_for_status("get session", response)
-                session_data = response.json()
+                session_data = _json(response)
                 attempt_duration = time.time() - attempt_start
                 
                 # Session exists and is accessible
@@ -270,26 +374,44 @@ class JulesClient:
                     ctx_logger.error(f"Failed to check session readiness: {exc}")
                     raise
 
-    async def _poll_for_response(self, session_id: str, *, attempts: int = 30, delay: float = 2.0, logger=None) -> str | None:
-        """Poll for activities and extract JSON response from Jules.
-        
+    async def _poll_for_response(
+        self,
+        session_id: str,
+        *,
+        attempts: int = 30,
+        delay: float = 2.0,
+        base_delay: float = 0.25,
+        max_delay: float = 8.0,
+        deadline: float = 300.0,
+        logger=None,
+    ) -> Dict[str, Any] | None:
+        """Poll for activities and extract the JSON response from Jules.
+
         Note: This assumes the session is already ready (not returning 404).
         Use _wait_for_session_ready() first to ensure the session is initialized.
-        
+
+        Polling uses jittered exponential backoff: fast early attempts shave
+        seconds off quick responses, while the growing (capped) delays keep
+        the request count low for slow sessions.
+
         Args:
             session_id: The session ID to poll
             attempts: Maximum number of polling attempts
-            delay: Base delay between attempts (seconds)
+            delay: Base delay for error-retry backoff (seconds)
+            base_delay: Initial delay of the happy-path polling schedule (seconds)
+            max_delay: Cap on the happy-path polling delay (seconds)
+            deadline: Wall-clock budget for the whole poll loop (seconds)
             logger: Optional logger instance
-            
+
         Returns:
-            JSON string if found, None if no response after all attempts
+            The parsed JSON object if found, None if no response after all attempts
         """
         if logger is None:
             logger = globals()['logger']
-        
+
         ctx_logger = log_with_context(logger, session_id=session_id)
-        ctx_logger.debug(f"Starting to poll for activities (max {attempts} attempts)")
+        ctx_logger.debug(f"Starting to poll for activities (max {attempts} attempts, {deadline:.0f}s deadline)")
+        deadline_ts = time.monotonic() + deadline
         
         # Track consecutive 404s (should be rare if session is ready, but handle gracefully)
         max_404_retries = 5
@@ -306,7 +428,7 @@ class JulesClient:
                     params={"pageSize": 50},
                 )
                 _raise_for_status("list activities", response)
-                response_data = response.json()
+                response_data = _json(response)
                 activities_count = len(response_data.get("activities", []))
                 attempt_duration = time.time() - attempt_start
                 ctx_logger.debug(f"Received {activities_count} activities (took {attempt_duration:.3f}s)")
@@ -366,36 +488,42 @@ class JulesClient:
             activities = response_data.get("activities", [])
             ctx_logger.debug(f"Received {len(activities)} activities on attempt {attempt + 1}")
             if activities:
-                # Log first activity structure (truncated)
+                # Serializing the preview is pure debug overhead; opt(lazy=True)
+                # defers it so production log levels never pay for the dumps.
                 first_activity = activities[0]
-                activity_preview = json.dumps(first_activity, indent=2)
-                if len(activity_preview) > 1000:
-                    activity_preview = activity_preview[:1000] + "\n... (truncated)"
-                ctx_logger.debug(f"First activity structure:\n{activity_preview}")
-            
-            # Check for agent messages in activities
-            agent_texts = list(_extract_agent_messages(response_data))
-            if agent_texts:
-                ctx_logger.debug(f"Extracted {len(agent_texts)} agent text fragments")
-                for idx, text in enumerate(agent_texts):
-                    preview = text[:200] + "..." if len(text) > 200 else text
-                    ctx_logger.debug(f"Fragment {idx + 1}: {preview}")
+                ctx_logger.opt(lazy=True).debug(
+                    "First activity structure:\n{preview}",
+                    preview=lambda: _activity_preview(first_activity),
+                )
             
-            for text in agent_texts:
+            # Scan agent messages once, attempting JSON extraction as we go so
+            # we stop at the first parseable fragment instead of materializing
+            # and re-walking the full fragment list.
+            fragment_count = 0
+            for text in _extract_agent_messages(response_data):
+                fragment_count += 1
+                preview = text[:200] + "..." if len(text) > 200 else text
+                ctx_logger.debug(f"Fragment {fragment_count}: {preview}")
                 if parsed := _extract_json_fragment(text):
                     ctx_logger.info(f"Found JSON response in activities on attempt {attempt + 1}")
                     return parsed
+            if fragment_count:
+                ctx_logger.debug(f"Scanned {fragment_count} agent text fragments without a JSON payload")
             
             # No response yet, wait before next attempt
             if attempt < attempts - 1:
-                # Use exponential backoff with a cap
-                sleep_time = min(delay * (1.2 ** attempt), 10.0)
+                # Jittered exponential backoff; jitter spreads polls from
+                # concurrent reviews so they don't hit the API in lockstep.
+                sleep_time = min(max_delay, base_delay * (2 ** attempt)) * random.uniform(0.5, 1.0)
+                if time.monotonic() + sleep_time > deadline_ts:
+                    ctx_logger.warning(f"Polling deadline ({deadline:.0f}s) reached without a response")
+                    break
                 ctx_logger.debug(
                     f"No JSON response yet (found {len(activities)} activities), "
                     f"sleeping {sleep_time:.2f}s before next attempt"
                 )
                 await asyncio.sleep(sleep_time)
-        
+
         # No response after all attempts
         ctx_logger.warning(f"No response received after {attempts} attempts")
         if last_error:
@@ -408,7 +536,7 @@ def _raise_for_status(action: str, response: httpx.Response) -> None:
         return
     detail: Any | None
     try:
-        detail = response.json()
+        detail = _json(response)
     except ValueError:
         detail = response.text
     raise JulesAPIError(f"Failed to {action}: status={response.status_code}, detail={detail}")
@@ -435,37 +563,54 @@ def _build_prompt(context: ReviewContext) -> str:
 
     files_instructions = _format_files_for_prompt(context)
 
-    instructions = (
-        "You are an automated code reviewer. Analyze the provided Git diff patches and "
-        "return actionable findings. Respond *only* with valid JSON matching this schema:\n"
-        "{\n"
-        "  \"summary\": string,\n"
-        "  \"comments\": [\n"
-        "    {\n"
-        "      \"path\": string,\n"
-        "      \"start_line\": integer,\n"
-        "      \"end_line\": integer|null,\n"
-        "      \"message\": string,\n"
-        "      \"severity\": one of [\"critical\", \"major\", \"minor\", \"info\"]\n"
-        "    }\n"
-        "  ]\n"
-        "}\n"
-        "Focus on bugs, security issues, or major regressions. Omit stylistic nitpicks."
-    )
-
-    return f"{instructions}\n\nContext:\n{header}\nDiffs:\n{files_instructions}".strip()
+    # Single join so the final buffer is allocated once; with 15 files at
+    # 4000 chars each, chained f-strings would copy the tail repeatedly.
+    return "".join((_INSTRUCTIONS, "\n\nContext:\n", header, "\nDiffs:\n", files_instructions)).strip()
+
+
+def _truncate_patch(patch: str, max_chars: int) -> str:
+    """Truncate an oversized unified-diff patch at a hunk boundary.
+
+    A raw character slice chops mid-hunk, leaving an unparseable tail that
+    wastes prompt tokens. Instead keep whole ``@@`` hunks until the budget is
+    exhausted and note how many were dropped.
+    """
+
+    hunks = [hunk for hunk in _HUNK_HEADER_RE.split(patch) if hunk]
+    kept: List[str] = []
+    total = 0
+    for hunk in hunks:
+        if total + len(hunk) > max_chars:
+            break
+        kept.append(hunk)
+        total += len(hunk)
+    if not kept:
+        # Leading hunk alone exceeds the budget (or no hunk structure): fall
+        # back to a raw slice so the cap holds even for huge single hunks.
+        return patch[:max_chars] + "\n... (truncated)"
+    omitted = len(hunks) - len(kept)
+    if omitted == 0:  # pragma: no cover - callers only truncate oversized patches
+        return patch
+    return "".join(kept).rstrip("\n") + f"\n... ({omitted} of {len(hunks)} hunks truncated)"
 
 
 def _format_files_for_prompt(context: ReviewContext, *, max_files: int = 15, max_patch_chars: int = 4000) -> str:
-    sections: List[str] = []
-    for index, file in enumerate(context.files[:max_files]):
+    # Accumulate flat pieces and join once at the end; appending the patch as
+    # its own element keeps each (up to 4000-char) body out of any
+    # intermediate per-file string.
+    parts: List[str] = []
+    files = context.files
+    for index, file in enumerate(files[:max_files]):
         patch = file.patch or "(no patch available)"
         if len(patch) > max_patch_chars:
-            patch = patch[:max_patch_chars] + "\n... (truncated)"
-        sections.append(f"### File {index + 1}: {file.path}\nStatus: {file.status}\nPatch:\n{patch}")
-    if len(context.files) > max_files:
-        sections.append(f"(Truncated to {max_files} files of {len(context.files)} total)")
-    return "\n\n".join(sections)
+            patch = _truncate_patch(patch, max_patch_chars)
+        if parts:
+            parts.append("\n\n")
+        parts.append(f"### File {index + 1}: {file.path}\nStatus: {file.status}\nPatch:\n")
+        parts.append(patch)
+    if len(files) > max_files:
+        parts.append(f"\n\n(Truncated to {max_files} files of {len(files)} total)")
+    return "".join(parts)
 
 
 def _extract_agent_messages(payload: Dict[str, Any]) -> Iterable[str]:
@@ -479,65 +624,75 @@ def _extract_agent_messages(payload: Dict[str, Any]) -> Iterable[str]:
     - outputs[].pullRequest.description: PR outputs
     
     Returns all text fragments that might contain the JSON review response.
+    Runs once per activity per polling attempt, so the loop binds ``.get``
+    locally and skips the ``or []`` fallback lists for absent keys.
     """
-    for activity in payload.get("activities", []):
-        if activity.get("originator") != "agent":
+    activities = payload.get("activities")
+    if not activities:
+        return
+    for activity in activities:
+        get = activity.get
+        if get("originator") != "agent":
             continue
 
         # Prioritize agentMessaged.agentMessage - this is where Jules returns the JSON response
         # Works for both PRs and commits (verified with commit reviews)
-        if agent_messaged := activity.get("agentMessaged"):
+        if agent_messaged := get("agentMessaged"):
             if agent_message := agent_messaged.get("agentMessage"):
                 yield agent_message
 
         # Also check messages array (if present)
-        messages = activity.get("messages") or []
-        for message in messages:
-            if text := message.get("text"):
-                yield text
+        if messages := get("messages"):
+            for message in messages:
+                if text := message.get("text"):
+                    yield text
 
         # Check progressUpdated.description (for progress updates)
-        progress = activity.get("progressUpdated")
+        progress = get("progressUpdated")
         if progress and (description := progress.get("description")):
             yield description
 
         # Check outputs (for pull requests, etc.)
-        outputs = activity.get("outputs") or []
-        for output in outputs:
-            if pull_request := output.get("pullRequest"):
-                if desc := pull_request.get("description"):
-                    yield desc
+        if outputs := get("outputs"):
+            for output in outputs:
+                if pull_request := output.get("pullRequest"):
+                    if desc := pull_request.get("description"):
+                        yield desc
 
 
-def _extract_json_fragment(text: str) -> str | None:
-    text = text.strip()
-    if not text:
-        return None
+def _extract_json_fragment(text: str) -> Dict[str, Any] | None:
+    """Find and parse the first JSON object embedded in ``text``.
 
-    # Handle markdown code blocks: ```json\n{...}\n```
-    if "```" in text:
-        # Match code block with optional json language tag
-        match = re.search(r"```(?:json)?\s*\n?(\{.*?\})\s*\n?```", text, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-
-    # Handle plain JSON object
-    if text.startswith("{") and text.endswith("}"):
-        return text
-
-    # Try to find JSON object anywhere in the text
-    match = re.search(r"(\{.*\})", text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
+    Scans for each ``{`` and hands off to ``raw_decode``, a C-implemented
+    scanner that stops at the first complete JSON value. This handles plain
+    objects, fenced code blocks, and prose-embedded JSON alike — and returns
+    the already-parsed dict, so callers never re-parse the payload.
+    """
+    idx = text.find("{")
+    while idx != -1:
+        try:
+            obj, _ = _DECODER.raw_decode(text, idx)
+        except ValueError:
+            idx = text.find("{", idx + 1)
+            continue
+        if isinstance(obj, dict):
+            return obj
+        idx = text.find("{", idx + 1)
     return None
 
 
-def _parse_analysis(raw_json: str) -> ReviewAnalysis | None:
-    try:
-        data = json.loads(raw_json)
-    except json.JSONDecodeError:
-        return None
+def _clean(value: str) -> str:
+    """Strip ``value`` only when an end is actually whitespace.
+
+    JSON string values usually arrive clean, so the two endpoint checks skip
+    the full double-ended scan ``str.strip`` would otherwise do per comment.
+    """
+    if value[:1].isspace() or value[-1:].isspace():
+        return value.strip()
+    return value
+
 
+def _parse_analysis(data: Dict[str, Any]) -> ReviewAnalysis:
     comments_data = data.get("comments") or []
     findings: List[ReviewFinding] = []
     for entry in comments_data:
@@ -558,14 +713,14 @@ def _parse_analysis(raw_json: str) -> ReviewAnalysis | None:
                 path=path,
                 start_line=start_line,
                 end_line=end_line,
-                message=message.strip(),
-                severity=(severity or "").strip() or None,
+                message=_clean(message),
+                severity=(_clean(severity) or None) if severity else None,
             )
         )
 
     summary = data.get("summary")
     if isinstance(summary, str):
-        summary = summary.strip()
+        summary = _clean(summary)
     else:
         summary = None
 
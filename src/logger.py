@@ -48,6 +48,9 @@ def configure_logger(*, log_dir: str | Path | None = None, level: str | None = N
         level=log_level,
         format=log_format,
         colorize=sys.stdout.isatty(),
+        # Hand writes to loguru's background thread so a slow stdout (e.g. a
+        # saturated container log driver) never blocks the event loop.
+        enqueue=True,
     )
     _logger.add(
         target_dir / "{time:YYYY-MM-DD}.log",
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
+from src.github_client import aclose_shared_client
 from src.manifest import router as manifest_router
 from src.register import router as register_router
 from src.setup_ui import router as setup_router
@@ -51,3 +52,4 @@ async def _configure_queue_worker() -> None:
 @app.on_event("shutdown")
 async def _shutdown_queue_worker() -> None:
     await shutdown_queue()
+    await aclose_shared_client()
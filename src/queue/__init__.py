@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import time
 from typing import Any, Awaitable, Callable
 
@@ -14,20 +15,34 @@ logger = get_logger()
 
 ReviewJobHandler = Callable[[ReviewJob], Awaitable[None]]
 
+DEFAULT_WORKER_COUNT = int(os.getenv("REVIEW_WORKERS", "2"))
+DEFAULT_MAX_PENDING = int(os.getenv("REVIEW_QUEUE_MAX", "100"))
+
+
+class ReviewQueueFullError(RuntimeError):
+    """Raised when the review queue is saturated and sheds an incoming job."""
+
 
 class _ReviewQueue:
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[ReviewJob] = asyncio.Queue()
-        self._worker: asyncio.Task[None] | None = None
+    def __init__(
+        self,
+        *,
+        worker_count: int = DEFAULT_WORKER_COUNT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._queue: asyncio.Queue[ReviewJob] = asyncio.Queue(maxsize=max_pending)
+        self._worker_count = max(1, worker_count)
+        self._workers: list[asyncio.Task[None]] = []
         self._handler: ReviewJobHandler | None = None
 
     def configure_handler(self, handler: ReviewJobHandler | None) -> None:
         self._handler = handler
 
-    def _ensure_worker(self) -> None:
-        if self._worker is None or self._worker.done():
-            loop = asyncio.get_running_loop()
-            self._worker = loop.create_task(self._worker_loop())
+    def _ensure_workers(self) -> None:
+        self._workers = [task for task in self._workers if not task.done()]
+        loop = asyncio.get_running_loop()
+        while len(self._workers) < self._worker_count:
+            self._workers.append(loop.create_task(self._worker_loop()))
 
     async def _worker_loop(self) -> None:
         while True:
@@ -66,19 +81,23 @@ class _ReviewQueue:
                 self._queue.task_done()
 
     async def enqueue(self, job: ReviewJob) -> None:
-        self._ensure_worker()
-        await self._queue.put(job)
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise ReviewQueueFullError(
+                f"Review queue is full ({self._queue.maxsize} pending jobs)."
+            ) from None
 
     async def shutdown(self) -> None:
-        if self._worker is None:
-            return
-        self._worker.cancel()
-        try:
-            await self._worker
-        except asyncio.CancelledError:  # pragma: no cover - expected during shutdown
-            pass
-        finally:
-            self._worker = None
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        for task in workers:
+            try:
+                await task
+            except asyncio.CancelledError:  # pragma: no cover - expected during shutdown
+                pass
 
     def pending(self) -> int:
         return self._queue.qsize()
@@ -11,10 +11,21 @@ from src.queue.models import PullRequestPayload, PushPayload, ReviewJob
 
 logger = get_logger()
 
+# GitHub sends an all-zero "before" SHA on branch-creation pushes.
+_ZERO_SHA = "0" * 40
+
+# Cumulative budget for patch text carried in a review context. The prompt
+# builder truncates far below this anyway, so keeping every patch of a huge
+# PR in memory only inflates peak RSS; files past the budget keep their
+# metadata but drop the patch body.
+MAX_TOTAL_PATCH_CHARS = 500_000
+
 
 def _serialize_files(files: List[dict]) -> List[FilePatch]:
     serialized: List[FilePatch] = []
     skipped_count = 0
+    patch_budget = MAX_TOTAL_PATCH_CHARS
+    dropped_patches = 0
     for file in files:
         # GitHub API may return "filename" or "path" depending on endpoint
         path = file.get("filename") or file.get("path")
@@ -22,15 +33,27 @@ def _serialize_files(files: List[dict]) -> List[FilePatch]:
             logger.warning(f"Skipping file entry missing filename/path: {file}")
             skipped_count += 1
             continue
+        patch = file.get("patch")
+        if patch:
+            if len(patch) > patch_budget:
+                patch = None
+                dropped_patches += 1
+            else:
+                patch_budget -= len(patch)
         serialized.append(
             FilePatch(
                 path=path,
                 status=file.get("status", ""),
                 additions=int(file.get("additions", 0) or 0),
                 deletions=int(file.get("deletions", 0) or 0),
-                patch=file.get("patch"),
+                patch=patch,
             )
         )
+    if dropped_patches > 0:
+        logger.warning(
+            f"Dropped patch bodies for {dropped_patches} file(s) beyond the "
+            f"{MAX_TOTAL_PATCH_CHARS}-char context budget (metadata retained)"
+        )
     if skipped_count > 0:
         logger.warning(f"Skipped {skipped_count} file(s) due to missing path/filename")
     logger.debug(f"Serialized {len(serialized)} file(s) from {len(files)} file entries")
@@ -60,8 +83,25 @@ async def build_review_context(
         if not payload.repository.full_name:
             raise ValueError("Push payload missing repository full name")
 
-        base_sha = payload.before or payload.after
+        before = payload.before if payload.before != _ZERO_SHA else None
+        base_sha = before or payload.after
         head_sha = payload.after
+
+        if base_sha == head_sha:
+            # Branch creation or a force-push to the same SHA: a self-compare
+            # always yields zero files, so skip the API round-trip entirely.
+            ctx_logger.info("Base and head SHAs are identical; skipping commit compare")
+            return PushReviewContext(
+                repository=payload.repository.full_name,
+                installation_id=payload.installation_id,
+                ref=payload.ref,
+                before=payload.before,
+                after=payload.after,
+                commits=list(payload.commits),
+                files=[],
+                compare_url=payload.compare,
+            )
+
         ctx_logger.info(f"Fetching commit compare: base={base_sha[:8] if base_sha else 'none'}, "
                        f"head={head_sha[:8] if head_sha else 'none'}")
         
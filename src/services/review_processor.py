@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+from collections import Counter
 from typing import Any, Dict, List
 
 from src.config import SettingsError, get_settings
@@ -20,6 +23,100 @@ from src.services.review_context import build_review_context
 
 logger = get_logger()
 
+# Cap for concurrent comment POSTs; GitHub secondary rate limits punish
+# unbounded write bursts.
+PUBLISH_CONCURRENCY = 5
+
+# Built once at import; comment formatting runs per finding.
+_SEVERITY_EMOJI = {
+    "critical": "🔴",
+    "major": "🟠",
+    "minor": "🟡",
+    "info": "ℹ️",
+}
+
+# Most severe first; unknown severities sort after the known levels.
+_SEVERITY_RANK = {level: rank for rank, level in enumerate(_SEVERITY_EMOJI)}
+
+# Re-runs on the same PR/commit (synchronize events, webhook redeliveries)
+# often reproduce identical findings; remember what we already posted so we
+# don't duplicate comments or burn write requests.
+FINDING_TTL_SECONDS = 60 * 60
+_posted_finding_cache: Dict[str, float] = {}
+
+# Redelivered webhooks (GitHub retries, manual replays) arrive with fresh
+# delivery ids, so the webhook-level dedup misses them. Remember which head
+# SHAs completed a review recently and skip the whole pipeline — including
+# the expensive Jules analysis — on a repeat.
+REVIEWED_SHA_TTL_SECONDS = 60 * 60
+_reviewed_sha_cache: Dict[tuple[Any, ...], float] = {}
+
+
+def _prune_reviewed_sha_cache(now: float) -> None:
+    expiry_threshold = now - REVIEWED_SHA_TTL_SECONDS
+    expired = [key for key, timestamp in _reviewed_sha_cache.items() if timestamp < expiry_threshold]
+    for key in expired:
+        _reviewed_sha_cache.pop(key, None)
+
+
+def _review_key(context: ReviewContext) -> tuple[Any, ...] | None:
+    # A push to a branch with an open PR fires both a push and a pull_request
+    # (synchronize) event for the same head SHA, and the deliverables differ
+    # (commit comments vs. an inline PR review) — so the key carries the
+    # review target, and dedup only suppresses true redeliveries.
+    if isinstance(context, PullRequestReviewContext):
+        if not context.head_sha:
+            return None
+        return ("pr", context.installation_id, context.pull_number, context.head_sha)
+    if not context.after:
+        return None
+    return ("push", context.installation_id, context.after)
+
+
+def _prune_finding_cache(now: float) -> None:
+    expiry_threshold = now - FINDING_TTL_SECONDS
+    expired = [key for key, timestamp in _posted_finding_cache.items() if timestamp < expiry_threshold]
+    for key in expired:
+        _posted_finding_cache.pop(key, None)
+
+
+def _finding_key(repository: str, target: str, finding: ReviewFinding) -> str:
+    # Non-cryptographic fingerprint; blake2b is faster than sha256 on short
+    # inputs and 16 bytes is plenty for dedup keys.
+    digest = hashlib.blake2b(
+        "\x1f".join((finding.path or "", str(finding.start_line or ""), finding.message)).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    return f"{repository}#{target}#{digest}"
+
+
+def _dedupe_findings(repository: str, target: str, findings: List[ReviewFinding]) -> List[ReviewFinding]:
+    """Drop findings already posted to this target (and in-batch repeats).
+
+    Selection only — call :func:`_mark_findings_posted` once the publish
+    succeeds. Recording here would suppress every finding for the TTL when
+    the POST fails (422 on a stale line number, 5xx after retries), making
+    the retried job silently publish nothing.
+    """
+
+    now = time.time()
+    _prune_finding_cache(now)
+    seen: set[str] = set()
+    kept: List[ReviewFinding] = []
+    for finding in findings:
+        key = _finding_key(repository, target, finding)
+        if key in _posted_finding_cache or key in seen:
+            continue
+        seen.add(key)
+        kept.append(finding)
+    return kept
+
+
+def _mark_findings_posted(repository: str, target: str, findings: List[ReviewFinding]) -> None:
+    now = time.time()
+    for finding in findings:
+        _posted_finding_cache[_finding_key(repository, target, finding)] = now
+
 
 class ReviewProcessorError(RuntimeError):
     """Raised when review processing fails."""
@@ -76,6 +173,23 @@ class ReviewProcessor:
                 f"installation_id={context.installation_id})"
             )
 
+            now = time.time()
+            _prune_reviewed_sha_cache(now)
+            review_key = _review_key(context)
+            if review_key and review_key in _reviewed_sha_cache:
+                repo_ctx_logger.info(
+                    f"Head {review_key[-1][:8]} was already reviewed recently; skipping redelivered job"
+                )
+                return
+
+            # Tag pushes, merges with no net diff, and empty compares produce
+            # no files; the analysis would have nothing to look at.
+            if not context.files:
+                repo_ctx_logger.info("No changed files in review context; skipping Jules analysis")
+                if review_key:
+                    _reviewed_sha_cache[review_key] = now
+                return
+
             jules_client = None
             analysis = None
             try:
@@ -97,13 +211,17 @@ class ReviewProcessor:
 
             if not analysis.comments and not analysis.summary:
                 repo_ctx_logger.info("No findings reported by Jules - review complete")
+                if review_key:
+                    _reviewed_sha_cache[review_key] = time.time()
                 return
 
             with log_timing(repo_ctx_logger, "publish_results"):
                 repo_ctx_logger.info(f"Publishing review results ({len(analysis.comments)} comments, "
                                   f"summary={'yes' if analysis.summary else 'no'})")
                 await self._publish_results(github_client, context, analysis)
-            
+
+            if review_key:
+                _reviewed_sha_cache[review_key] = time.time()
             log_success(logger, f"Review processing completed successfully for {context.repository}",
                        delivery_id=job.delivery_id, event_type=job.event, repository=context.repository)
         finally:
@@ -144,14 +262,22 @@ class ReviewProcessor:
         analysis: ReviewAnalysis,
     ) -> None:
         ctx_logger = log_with_context(logger, repository=context.repository)
-        
+
+        findings = _dedupe_findings(context.repository, f"pr-{context.pull_number}", analysis.comments)
+        if len(findings) < len(analysis.comments):
+            ctx_logger.info(f"Skipping {len(analysis.comments) - len(findings)} previously posted finding(s)")
+
         comments_payload = [
             _build_pr_comment_payload(finding)
-            for finding in analysis.comments
+            for finding in findings
             if finding.path and finding.start_line
         ]
 
-        summary_body = _format_summary_body(analysis.summary, analysis.comments)
+        # As in the push path: a fully-deduped re-run must not re-post the
+        # bare summary, so it rides along only with fresh findings.
+        summary_body = None
+        if findings or not analysis.comments:
+            summary_body = _format_summary_body(analysis.summary, findings)
 
         if not comments_payload and not summary_body:
             ctx_logger.info(f"Jules produced no actionable comments for PR #{context.pull_number}")
@@ -166,6 +292,7 @@ class ReviewProcessor:
             body=summary_body,
             comments=comments_payload,
         )
+        _mark_findings_posted(context.repository, f"pr-{context.pull_number}", findings)
 
     async def _publish_push_review(
         self,
@@ -180,30 +307,35 @@ class ReviewProcessor:
             ctx_logger.warning("Push review missing target commit SHA; skipping comment publish")
             return
 
-        comments_posted = 0
-        for finding in analysis.comments:
-            body = _format_comment_body(finding)
-            await github_client.create_commit_comment(
-                installation_id=context.installation_id,
-                full_name=context.repository,
-                commit_sha=target_commit,
-                body=body,
-                path=finding.path,
-                line=finding.start_line,
-            )
-            comments_posted += 1
-
-        if analysis.summary:
-            summary_body = _format_summary_body(analysis.summary, analysis.comments)
-            await github_client.create_commit_comment(
-                installation_id=context.installation_id,
-                full_name=context.repository,
-                commit_sha=target_commit,
-                body=summary_body,
-            )
-            comments_posted += 1
-        
-        ctx_logger.info(f"Posted {comments_posted} comment(s) to commit {target_commit[:8]}")
+        findings = _dedupe_findings(context.repository, target_commit, analysis.comments)
+        if len(findings) < len(analysis.comments):
+            ctx_logger.info(f"Skipping {len(analysis.comments) - len(findings)} previously posted finding(s)")
+
+        payloads: List[Dict[str, Any]] = []
+        for finding in findings:
+            payload: Dict[str, Any] = {"body": _format_comment_body(finding)}
+            if finding.path:
+                payload["path"] = finding.path
+            if finding.start_line:
+                payload["line"] = finding.start_line
+            payloads.append(payload)
+
+        # Re-posting only the summary on a re-run would duplicate it without
+        # adding information, so it rides along only with fresh findings.
+        if analysis.summary and (findings or not analysis.comments):
+            summary_body = _format_summary_body(analysis.summary, findings)
+            if summary_body:
+                payloads.append({"body": summary_body})
+
+        await github_client.create_commit_comments_bulk(
+            installation_id=context.installation_id,
+            full_name=context.repository,
+            commit_sha=target_commit,
+            comments=payloads,
+            concurrency=PUBLISH_CONCURRENCY,
+        )
+        _mark_findings_posted(context.repository, target_commit, findings)
+        ctx_logger.info(f"Posted {len(payloads)} comment(s) to commit {target_commit[:8]}")
 
 
 def _build_pr_comment_payload(finding: ReviewFinding) -> Dict[str, Any]:
@@ -221,10 +353,10 @@ def _build_pr_comment_payload(finding: ReviewFinding) -> Dict[str, Any]:
 
 
 def _format_comment_body(finding: ReviewFinding) -> str:
-    severity_line = f"**Severity:** {finding.severity.capitalize()}" if finding.severity else None
     parts = [finding.message.strip()]
-    if severity_line:
-        parts.append(severity_line)
+    if finding.severity:
+        emoji = _SEVERITY_EMOJI.get(finding.severity.lower(), "ℹ️")
+        parts.append(f"{emoji} **Severity:** {finding.severity.capitalize()}")
     return "\n\n".join(parts)
 
 
@@ -233,19 +365,20 @@ def _format_summary_body(summary: str | None, findings: List[ReviewFinding]) ->
     if not summary and not findings:
         return None
 
-    severity_counts: Dict[str, int] = {}
-    for finding in findings:
-        if finding.severity:
-            key = finding.severity.lower()
-        else:
-            key = "unspecified"
-        severity_counts[key] = severity_counts.get(key, 0) + 1
+    severity_counts = Counter(
+        finding.severity.lower() if finding.severity else "unspecified"
+        for finding in findings
+    )
 
     lines = []
     if summary:
         lines.append(summary)
     if severity_counts:
-        counts_line = ", ".join(f"{count} {level}" for level, count in severity_counts.items())
+        ordered = sorted(
+            severity_counts.items(),
+            key=lambda item: (_SEVERITY_RANK.get(item[0], len(_SEVERITY_RANK)), item[0]),
+        )
+        counts_line = ", ".join(f"{count} {level}" for level, count in ordered)
         lines.append(f"Findings by severity: {counts_line}")
     return "\n\n".join(lines).strip() or None
 
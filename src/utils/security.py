@@ -16,7 +16,9 @@ def build_github_signature(secret: str, payload: bytes) -> str:
 def verify_github_signature(secret: str, payload: bytes, raw_signature: str | None) -> bool:
     """Verify a GitHub webhook signature using a constant-time comparison."""
 
-    if not raw_signature:
+    # Cheap shape check first: a valid header is exactly "sha256=" plus 64 hex
+    # chars, so malformed headers are rejected without hashing the payload.
+    if not raw_signature or len(raw_signature) != 71 or not raw_signature.startswith("sha256="):
         return False
 
     expected_signature = build_github_signature(secret, payload)
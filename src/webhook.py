@@ -12,7 +12,7 @@ from pydantic import ValidationError
 from src.config import Settings, SettingsError
 from src.dependencies import settings_dependency
 from src.logger import get_logger, log_with_context, log_timing, log_success, log_failure
-from src.queue import enqueue_review_job
+from src.queue import ReviewQueueFullError, enqueue_review_job
 from src.queue.models import (
     PullRequestInfo,
     PullRequestPayload,
@@ -127,12 +127,18 @@ def _build_pull_request_job(payload: Dict[str, Any]) -> PullRequestPayload:
     )
 
 
+# Event-name dispatch; adding a new event type means registering its builder.
+_job_builders = {
+    "push": _build_push_job,
+    "pull_request": _build_pull_request_job,
+}
+
+
 def _build_job_payload(event: str, payload: Dict[str, Any]) -> PushPayload | PullRequestPayload:
-    if event == "push":
-        return _build_push_job(payload)
-    if event == "pull_request":
-        return _build_pull_request_job(payload)
-    raise IgnoreEventError(f"Event '{event}' is not handled.")
+    builder = _job_builders.get(event)
+    if builder is None:
+        raise IgnoreEventError(f"Event '{event}' is not handled.")
+    return builder(payload)
 
 
 @router.post("/webhook", summary="Receive GitHub webhooks")
@@ -242,6 +248,12 @@ async def receive_webhook(
         with log_timing(ctx_logger, "enqueue_review_job"):
             await enqueue_review_job(job)
             ctx_logger.info("Review job enqueued successfully")
+    except ReviewQueueFullError as exc:
+        log_failure(logger, f"Review queue saturated: {exc}", exc, delivery_id=delivery_id, event_type=event, repository=repo_name)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Review queue is full; retry later"
+        ) from exc
     except Exception as exc:  # pragma: no cover - defensive logging
         log_failure(logger, f"Failed to enqueue review job: {exc}", exc, delivery_id=delivery_id, event_type=event, repository=repo_name)
         raise HTTPException(